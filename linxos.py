@@ -6,35 +6,109 @@ LinX OS SDK 统一编译工具
 """
 
 import os
+import re
 import sys
 import json
+import pickle
 import argparse
+import functools
 import subprocess
 import shutil
+import hashlib
+import threading
+import concurrent.futures
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-# 颜色输出
-class Colors:
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    CYAN = '\033[0;36m'
-    MAGENTA = '\033[0;35m'
-    NC = '\033[0m'  # No Color
+# 参与源码树指纹计算的文件后缀
+_FP_SUFFIXES = (".c", ".h", ".cpp")
+
+# 颜色输出（模块级常量，省去每次经类属性查找）
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+CYAN = '\033[0;36m'
+MAGENTA = '\033[0;35m'
+NC = '\033[0m'  # No Color
+
+# 设置了 NO_COLOR 或输出被重定向时，不发任何 ANSI 转义码
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = NC = ""
+
+# 日志前缀在模块加载时拼好
+_INFO_PREFIX = f"{BLUE}[LinX OS]{NC}"
+_WARN_PREFIX = f"{YELLOW}[LinX OS]{NC}"
+_ERROR_PREFIX = f"{RED}[LinX OS]{NC}"
+_SUCCESS_PREFIX = f"{GREEN}[LinX OS]{NC}"
 
 def log_info(msg: str):
-    print(f"{Colors.BLUE}[LinX OS]{Colors.NC} {msg}")
+    print(_INFO_PREFIX, msg)
 
 def log_warn(msg: str):
-    print(f"{Colors.YELLOW}[LinX OS]{Colors.NC} {msg}")
+    print(_WARN_PREFIX, msg)
 
 def log_error(msg: str):
-    print(f"{Colors.RED}[LinX OS]{Colors.NC} {msg}")
+    print(_ERROR_PREFIX, msg)
 
 def log_success(msg: str):
-    print(f"{Colors.GREEN}[LinX OS]{Colors.NC} {msg}")
+    print(_SUCCESS_PREFIX, msg)
+
+def _find_executable(bin_dir: Path) -> Optional[str]:
+    """在 bin 目录中查找第一个可执行文件（目录不存在时返回 None）"""
+    try:
+        with os.scandir(bin_dir) as it:
+            return next((entry.path for entry in it
+                         if entry.is_file(follow_symlinks=False)
+                         and os.access(entry.path, os.X_OK)), None)
+    except OSError:
+        return None
+
+def _fast_rmtree(path):
+    """递归删除目录树，基于 os.scandir 的 d_type 判断类型，避免逐项 stat"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+# KEY=value 行（可带双引号）；注释行不会匹配，因为 # 不是标识符字符
+_CFG_RE = re.compile(
+    rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"?([^"\r\n]*?)"?[ \t]*$',
+    re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def _parse_config_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """实际解析配置文件，按 (路径, mtime, 大小) 缓存，文件未变时直接复用结果
+
+    整体读入字节后交给预编译正则匹配，避免 Python 层逐行循环；
+    值按 UTF-8 宽容解码（errors='replace'），畸形编码不会导致解析失败。
+    """
+    try:
+        data = Path(path_str).read_bytes()
+    except Exception as e:
+        log_warn(f"解析配置文件失败 {path_str}: {e}")
+        return {}
+
+    return {
+        m.group(1).decode(): m.group(2).decode('utf-8', 'replace').strip("'")
+        for m in _CFG_RE.finditer(data)
+    }
+
+@dataclass(slots=True)
+class BuildConfig:
+    """当前生效的编译配置（属性访问比字典键查找更快，也杜绝键名笔误）"""
+    target: str = "native"
+    board: str = "mac"
+    build_type: str = "Release"
+    toolchain_file: str = ""
+    toolchain_prefix: str = ""
+    description: str = "默认配置"
+    sdk_built: bool = False
+    board_built: bool = False
 
 class LinxOSBuilder:
     """LinX OS 统一编译工具"""
@@ -46,17 +120,50 @@ class LinxOSBuilder:
         self.config_file = self.sdk_path / "sdkconfig"
         self.configs_dir = self.build_dir / "configs"
         
-        # 确保目录存在
-        self.build_dir.mkdir(exist_ok=True)
+        # 确保目录存在（configs_dir 在 build_dir 之下，一次调用建整条链）
+        self.configs_dir.mkdir(parents=True, exist_ok=True)
         self.out_dir.mkdir(exist_ok=True)
-        self.configs_dir.mkdir(exist_ok=True)
         
-        # 项目配置
-        self.projects = self._scan_projects()
-        self.available_configs = self._scan_configs()
-        self.current_config = None  # 先设为None
-        self.current_config = self._load_config()  # 再加载配置
-    
+        # 配置解析缓存（跨进程持久化，避免重复解析未变化的配置文件）
+        self._config_cache_file = self.build_dir / ".config_cache.pkl"
+        self._config_disk_cache = self._load_config_cache()
+
+        # 有 Ninja 时优先使用（空跑/增量构建显著更快），否则退回默认生成器
+        self._cmake_generator = ["-G", "Ninja"] if shutil.which("ninja") else []
+
+        # 并行任务数只计算一次；并行编译示例时 -j 在子任务间均分
+        self._jobs = str(os.cpu_count() or 4)
+        self._jobs_per_child = self._jobs
+
+        # 编译产物存在性检查的缓存，避免重复 stat 同一文件
+        # 热路径上用纯字符串拼接，省去反复构造 Path 对象
+        self._lib_dir = os.path.join(str(self.out_dir), "linx", "lib")
+        self._stat_cache: Dict[str, bool] = {}
+
+        # 编译过的项目清单（持久化），clean 时只需遍历清单中的项目
+        self._built_manifest_file = self.out_dir / ".built.json"
+        self._built_projects: set = set()
+        self._manifest_lock = threading.Lock()
+
+        # 配置选择界面的列表渲染缓存
+        self._configs_render: Optional[str] = None
+
+        # build_all/build_examples 验证过 SDK+Board 后，子项目不再重复检查
+        self._deps_verified_this_run = False
+
+        # 项目/配置扫描延迟到首次访问，快速命令（如 build sdk）无需扫描
+        self.current_config = self._load_config()
+
+    @functools.cached_property
+    def projects(self) -> Dict:
+        """可用项目（首次访问时扫描）"""
+        return self._scan_projects()
+
+    @functools.cached_property
+    def available_configs(self) -> Dict:
+        """可用配置（首次访问时扫描）"""
+        return self._scan_configs()
+
     def _scan_configs(self) -> Dict:
         """扫描可用的配置文件"""
         configs = {}
@@ -74,24 +181,40 @@ class LinxOSBuilder:
         
         return configs
     
+    def _load_config_cache(self) -> Dict:
+        """加载持久化的配置解析缓存"""
+        try:
+            with open(self._config_cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except Exception:
+            pass
+        return {}
+
+    def _save_config_cache(self):
+        """保存配置解析缓存"""
+        try:
+            with open(self._config_cache_file, 'wb') as f:
+                pickle.dump(self._config_disk_cache, f)
+        except Exception:
+            pass
+
     def _parse_config_file(self, config_file: Path) -> Dict:
-        """解析配置文件"""
-        config_data = {}
-        
+        """解析配置文件（文件未变化时命中缓存，跳过重新解析）"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            # 去除引号
-                            value = value.strip('"\'')
-                            config_data[key] = value
-        except Exception as e:
-            log_warn(f"解析配置文件失败 {config_file}: {e}")
+            st = os.stat(config_file)
+        except OSError:
             return {}
-        
+
+        path_str = str(config_file)
+        cached = self._config_disk_cache.get(path_str)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        config_data = _parse_config_cached(path_str, st.st_mtime_ns, st.st_size)
+        self._config_disk_cache[path_str] = (st.st_mtime_ns, st.st_size, config_data)
+        self._save_config_cache()
         return config_data
 
     def _scan_projects(self) -> Dict:
@@ -101,144 +224,231 @@ class LinxOSBuilder:
             "examples": {}
         }
         
-        # 扫描 apps 目录
+        # 扫描 apps 目录 (os.scandir 复用 readdir 的 d_type，避免每项额外 stat)
         apps_dir = self.sdk_path / "apps"
         if apps_dir.exists():
-            for item in apps_dir.iterdir():
-                if item.is_dir():
-                    projects["apps"][item.name] = {
-                        "path": str(item),
-                        "type": "app",
-                        "platform": self._detect_platform(item)
-                    }
-        
+            with os.scandir(apps_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        projects["apps"][entry.name] = {
+                            "path": entry.path,
+                            "type": "app",
+                            "platform": self._detect_platform(entry.path)
+                        }
+
         # 扫描 examples 目录
         examples_dir = self.sdk_path / "examples"
         if examples_dir.exists():
-            for item in examples_dir.iterdir():
-                if item.is_dir():
-                    projects["examples"][item.name] = {
-                        "path": str(item),
-                        "type": "example",
-                        "platform": item.name  # examples 目录名就是平台名
-                    }
-        
+            with os.scandir(examples_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        projects["examples"][entry.name] = {
+                            "path": entry.path,
+                            "type": "example",
+                            "platform": entry.name  # examples 目录名就是平台名
+                        }
+
         return projects
-    
-    def _detect_platform(self, project_path: Path) -> str:
+
+    def _detect_platform(self, project_path: str) -> str:
         """检测项目平台"""
         # 检查是否有特定的配置文件
-        if (project_path / "sdkconfig").exists():
+        if os.path.exists(os.path.join(project_path, "sdkconfig")):
             return "esp32"
-        elif (project_path / "CMakeLists.txt").exists():
+        elif os.path.exists(os.path.join(project_path, "CMakeLists.txt")):
             return "native"
         else:
             return "unknown"
     
-    def _load_config(self) -> Dict:
-        """加载当前配置"""
-        config = {
-            "target": "native",
-            "board": "mac",
-            "build_type": "Release",
-            "toolchain_file": "",
-            "toolchain_prefix": "",
-            "description": "默认配置",
-            "sdk_built": False,
-            "board_built": False
-        }
-        
-        if self.config_file.exists():
+    def _load_config(self, config_data: Optional[Dict] = None) -> BuildConfig:
+        """加载当前配置；可传入已解析的配置数据，避免重新读取文件"""
+        if config_data is None and self.config_file.exists():
             try:
                 config_data = self._parse_config_file(self.config_file)
-                if config_data:
-                    config.update({
-                        "target": config_data.get("CONFIG_TARGET_PLATFORM", "native"),
-                        "board": config_data.get("CONFIG_BOARD_PLATFORM", "mac"),
-                        "build_type": config_data.get("CONFIG_BUILD_TYPE", "Release"),
-                        "toolchain_file": config_data.get("CONFIG_TOOLCHAIN_FILE", ""),
-                        "toolchain_prefix": config_data.get("CONFIG_TOOLCHAIN_PREFIX", ""),
-                        "description": config_data.get("CONFIG_DESCRIPTION", "当前配置")
-                    })
             except Exception as e:
                 log_warn(f"读取配置文件失败: {e}")
-        
+
+        config = BuildConfig()
+        if config_data:
+            config.target = config_data.get("CONFIG_TARGET_PLATFORM", "native")
+            config.board = config_data.get("CONFIG_BOARD_PLATFORM", "mac")
+            config.build_type = config_data.get("CONFIG_BUILD_TYPE", "Release")
+            config.toolchain_file = config_data.get("CONFIG_TOOLCHAIN_FILE", "")
+            config.toolchain_prefix = config_data.get("CONFIG_TOOLCHAIN_PREFIX", "")
+            config.description = config_data.get("CONFIG_DESCRIPTION", "当前配置")
+
         # 检查SDK和Board是否已编译
-        config["sdk_built"] = self._check_sdk_built()
-        config["board_built"] = self._check_board_built()
-        
+        config.sdk_built = self._check_sdk_built()
+        config.board_built = self._check_board_built(config.board)
+
         return config
-    
+
+    def _load_built_manifest(self) -> set:
+        """读取持久化的已编译项目清单"""
+        try:
+            with open(self._built_manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if isinstance(manifest, list):
+                return set(manifest)
+        except Exception:
+            pass
+        return set()
+
+    def _record_built_project(self, project_type: str, project_name: str):
+        """把编译成功的项目记入清单"""
+        with self._manifest_lock:
+            self._built_projects.add(f"{project_type}/{project_name}")
+            self._built_projects.update(self._load_built_manifest())
+            try:
+                with open(self._built_manifest_file, 'w', encoding='utf-8') as f:
+                    json.dump(sorted(self._built_projects), f)
+            except OSError:
+                pass
+
+    def _sdk_lib_path(self) -> str:
+        return os.path.join(self._lib_dir, "liblinx_sdk_static.a")
+
+    def _board_lib_path(self, board: str) -> str:
+        return os.path.join(self._lib_dir, f"liblinx_board_{board}.a")
+
+    def _sdk_fingerprint_file(self) -> Path:
+        return self.out_dir / "linx" / ".sdk_fingerprint"
+
+    def _board_fingerprint_file(self, board: str) -> Path:
+        return self.out_dir / "linx" / f".board_fingerprint_{board}"
+
+    def _fingerprint(self, root: Path) -> str:
+        """计算源码树指纹（源文件的 mtime+size），用于判断产物是否过期"""
+        h = hashlib.blake2b(digest_size=16)
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.path)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # 跳过构建输出和隐藏目录，否则指纹永远过期
+                    if name != "build" and not name.startswith('.'):
+                        stack.append(entry.path)
+                elif name.endswith(_FP_SUFFIXES) or name == "CMakeLists.txt":
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    h.update(entry.path.encode())
+                    h.update(f":{st.st_mtime_ns}:{st.st_size};".encode())
+        return h.hexdigest()
+
+    def _fingerprint_matches(self, fp_file: Path, root: Path) -> bool:
+        """比较已保存的指纹和当前源码树"""
+        try:
+            stored = fp_file.read_text().strip()
+        except OSError:
+            return False
+        return stored == self._fingerprint(root)
+
+    def _write_fingerprint(self, fp_file: Path, root: Path):
+        """编译成功后记录源码树指纹"""
+        try:
+            fp_file.parent.mkdir(parents=True, exist_ok=True)
+            fp_file.write_text(self._fingerprint(root))
+        except OSError as e:
+            log_warn(f"写入指纹文件失败 {fp_file}: {e}")
+
     def _check_sdk_built(self) -> bool:
-        """检查SDK是否已编译"""
-        sdk_lib = self.out_dir / "linx" / "lib" / "liblinx_sdk_static.a"
-        return sdk_lib.exists()
-    
-    def _check_board_built(self) -> bool:
-        """检查Board是否已编译"""
-        # 如果current_config还未初始化，使用默认值
-        if self.current_config is None:
-            board = "mac"
-        else:
-            board = self.current_config.get("board", "mac")
-        board_lib = self.out_dir / "linx" / "lib" / f"liblinx_board_{board}.a"
-        return board_lib.exists()
+        """检查SDK是否已编译且源码未变化"""
+        sdk_lib = self._sdk_lib_path()
+        cached = self._stat_cache.get(sdk_lib)
+        if cached is None:
+            cached = self._stat_cache[sdk_lib] = (
+                os.path.exists(sdk_lib)
+                and self._fingerprint_matches(self._sdk_fingerprint_file(),
+                                              self.sdk_path / "sdk")
+            )
+        return cached
+
+    def _check_board_built(self, board: str) -> bool:
+        """检查指定Board是否已编译且源码未变化"""
+        board_lib = self._board_lib_path(board)
+        cached = self._stat_cache.get(board_lib)
+        if cached is None:
+            cached = self._stat_cache[board_lib] = (
+                os.path.exists(board_lib)
+                and self._fingerprint_matches(self._board_fingerprint_file(board),
+                                              self.sdk_path / "board" / board)
+            )
+        return cached
     
     def list_projects(self):
         """列出所有可用项目"""
-        print(f"\n{Colors.CYAN}可用项目列表:{Colors.NC}")
+        print(f"\n{CYAN}可用项目列表:{NC}")
         print("=" * 60)
         
         # 显示 Apps
         if self.projects["apps"]:
-            print(f"\n{Colors.GREEN}应用程序 (Apps):{Colors.NC}")
+            print(f"\n{GREEN}应用程序 (Apps):{NC}")
             for name, info in self.projects["apps"].items():
                 platform = info["platform"]
-                print(f"  {Colors.YELLOW}{name:20}{Colors.NC} - 平台: {platform}")
+                print(f"  {YELLOW}{name:20}{NC} - 平台: {platform}")
         
         # 显示 Examples
         if self.projects["examples"]:
-            print(f"\n{Colors.GREEN}示例程序 (Examples):{Colors.NC}")
+            print(f"\n{GREEN}示例程序 (Examples):{NC}")
             for name, info in self.projects["examples"].items():
                 platform = info["platform"]
-                print(f"  {Colors.YELLOW}{name:20}{Colors.NC} - 平台: {platform}")
+                print(f"  {YELLOW}{name:20}{NC} - 平台: {platform}")
         
         print()
     
+    def _render_config_list(self) -> str:
+        """渲染可用配置列表（结果缓存，配置切换时由 _apply_config 清除）"""
+        if self._configs_render is None:
+            lines = [f"\n{GREEN}可用配置选项:{NC}", "-" * 60]
+            for i, (config_name, config_info) in enumerate(self.available_configs.items(), 1):
+                description = config_info["description"]
+                target = config_info["data"].get("CONFIG_TARGET_PLATFORM", "unknown")
+                board = config_info["data"].get("CONFIG_BOARD_PLATFORM", "unknown")
+                lines.append(f"  {i:2d}. {config_name:15} - {description}")
+                lines.append(f"      平台: {target:10} 板框: {board}")
+            lines.append("-" * 60)
+            lines.append('输入 "q" 退出配置选择')
+            self._configs_render = "\n".join(lines) + "\n"
+        return self._configs_render
+
     def config_choice(self):
         """配置选择界面"""
-        print(f"\n{Colors.CYAN}LinX OS SDK 配置选择:{Colors.NC}")
-        print("=" * 60)
-        
-        # 显示当前配置
-        print(f"当前配置:")
-        print(f"  配置名称: {self.current_config.get('description', '未知')}")
-        print(f"  目标平台: {self.current_config['target']}")
-        print(f"  板框平台: {self.current_config['board']}")
-        print(f"  构建类型: {self.current_config['build_type']}")
-        print(f"  工具链文件: {self.current_config.get('toolchain_file', '无')}")
-        print(f"  SDK状态: {'已编译' if self.current_config['sdk_built'] else '未编译'}")
-        print(f"  Board状态: {'已编译' if self.current_config['board_built'] else '未编译'}")
-        
+        # 编译状态只在进入界面时检查一次
+        sdk_built = self._check_sdk_built()
+        board_built = self._check_board_built(self.current_config.board)
+
+        # 头部一次性写出，避免逐行 print 的多次刷新
+        sys.stdout.write(
+            f"\n{CYAN}LinX OS SDK 配置选择:{NC}\n"
+            + "=" * 60 + "\n"
+            "当前配置:\n"
+            f"  配置名称: {self.current_config.description}\n"
+            f"  目标平台: {self.current_config.target}\n"
+            f"  板框平台: {self.current_config.board}\n"
+            f"  构建类型: {self.current_config.build_type}\n"
+            f"  工具链文件: {self.current_config.toolchain_file}\n"
+            f"  SDK状态: {'已编译' if sdk_built else '未编译'}\n"
+            f"  Board状态: {'已编译' if board_built else '未编译'}\n"
+        )
+
         # 显示可用配置
         if not self.available_configs:
+            sys.stdout.flush()
             log_warn("未找到可用的配置文件")
             return False
-        
-        print(f"\n{Colors.GREEN}可用配置选项:{Colors.NC}")
-        print("-" * 60)
-        
+
         config_list = list(self.available_configs.items())
-        for i, (config_name, config_info) in enumerate(config_list, 1):
-            description = config_info["description"]
-            target = config_info["data"].get("CONFIG_TARGET_PLATFORM", "unknown")
-            board = config_info["data"].get("CONFIG_BOARD_PLATFORM", "unknown")
-            print(f"  {i:2d}. {config_name:15} - {description}")
-            print(f"      平台: {target:10} 板框: {board}")
-        
-        print("-" * 60)
-        print('输入 "q" 退出配置选择')
-        
+        sys.stdout.write(self._render_config_list())
+        sys.stdout.flush()
+
         try:
             choice = input(f"\n请选择配置 (1-{len(config_list)}, 回车保持当前配置): ").strip()
             
@@ -269,30 +479,23 @@ class LinxOSBuilder:
     def _apply_config(self, config_name: str, config_info: Dict) -> bool:
         """应用选定的配置"""
         try:
-            config_data = config_info["data"]
-            
+            # 直接复用已解析的配置数据，避免写入后重新读取解析 sdkconfig
+            self.current_config = self._load_config(config_info["data"])
+            self.current_config.description = config_info["description"]
+
             # 复制配置文件内容到sdkconfig
-            shutil.copy2(config_info["file"], self.config_file)
-            
-            # 更新当前配置
-            self.current_config.update({
-                "target": config_data.get("CONFIG_TARGET_PLATFORM", "native"),
-                "board": config_data.get("CONFIG_BOARD_PLATFORM", "mac"),
-                "build_type": config_data.get("CONFIG_BUILD_TYPE", "Release"),
-                "toolchain_file": config_data.get("CONFIG_TOOLCHAIN_FILE", ""),
-                "toolchain_prefix": config_data.get("CONFIG_TOOLCHAIN_PREFIX", ""),
-                "description": config_data.get("CONFIG_DESCRIPTION", config_name)
-            })
-            
-            # 重新检查编译状态
-            self.current_config["sdk_built"] = self._check_sdk_built()
-            self.current_config["board_built"] = self._check_board_built()
+            self.config_file.write_bytes(Path(config_info["file"]).read_bytes())
+
+            # sdkconfig 已被覆盖，失效其缓存条目和界面渲染缓存
+            self._config_disk_cache.pop(str(self.config_file), None)
+            self._save_config_cache()
+            self._configs_render = None
             
             log_success(f"已选择配置: {config_name}")
             log_info(f"配置描述: {config_info['description']}")
             
             # 如果切换了配置，提示可能需要重新编译
-            if not self.current_config["sdk_built"] or not self.current_config["board_built"]:
+            if not self.current_config.sdk_built or not self.current_config.board_built:
                 log_warn("配置已更改，建议重新编译SDK和Board")
                 log_info("使用 './linxos.py build-sdk -f' 和 './linxos.py build-board -f' 重新编译")
             
@@ -304,7 +507,7 @@ class LinxOSBuilder:
 
     def build_sdk(self, force: bool = False) -> bool:
         """编译SDK"""
-        if self.current_config["sdk_built"] and not force:
+        if self.current_config.sdk_built and not force:
             log_info("SDK已编译，跳过编译步骤")
             return True
         
@@ -316,18 +519,19 @@ class LinxOSBuilder:
             
             # 清理构建目录（如果强制重新编译）
             if force and sdk_build_dir.exists():
-                shutil.rmtree(sdk_build_dir)
+                _fast_rmtree(sdk_build_dir)
             
             sdk_build_dir.mkdir(exist_ok=True)
             
             # 配置CMake
             cmake_args = [
                 "cmake",
-                f"-DCMAKE_BUILD_TYPE={self.current_config['build_type']}"
+                *self._cmake_generator,
+                f"-DCMAKE_BUILD_TYPE={self.current_config.build_type}"
             ]
             
             # 添加工具链文件（如果有）
-            toolchain_file = self.current_config.get('toolchain_file')
+            toolchain_file = self.current_config.toolchain_file
             if toolchain_file:
                 toolchain_path = self.build_dir / "toolchains" / toolchain_file
                 if toolchain_path.exists():
@@ -344,22 +548,16 @@ class LinxOSBuilder:
                 log_error("SDK CMake配置失败")
                 return False
             
-            # 编译SDK
-            make_args = ["make", "-j", str(os.cpu_count() or 4)]
-            log_info(f"编译SDK: {' '.join(make_args)}")
-            result = subprocess.run(make_args, cwd=sdk_build_dir)
-            
-            if result.returncode != 0:
-                log_error("SDK编译失败")
-                return False
-            
-            # 安装SDK
-            install_args = ["make", "install"]
-            log_info(f"安装SDK: {' '.join(install_args)}")
-            result = subprocess.run(install_args, cwd=sdk_build_dir)
-            
+            # 编译并安装SDK（单次 cmake --build 驱动，免去多次 make 进程开销）
+            build_args = ["cmake", "--build", str(sdk_build_dir), "--target", "install",
+                          "-j", self._jobs]
+            log_info(f"编译SDK: {' '.join(build_args)}")
+            result = subprocess.run(build_args)
+
             if result.returncode == 0:
-                self.current_config["sdk_built"] = True
+                self._write_fingerprint(self._sdk_fingerprint_file(), sdk_dir)
+                self._stat_cache.pop(self._sdk_lib_path(), None)
+                self.current_config.sdk_built = True
                 log_success("SDK编译成功")
                 return True
             else:
@@ -372,18 +570,18 @@ class LinxOSBuilder:
     
     def build_board(self, force: bool = False) -> bool:
         """编译Board适配"""
-        if not self.current_config["sdk_built"]:
+        if not self.current_config.sdk_built:
             log_error("请先编译SDK")
             return False
         
-        if self.current_config["board_built"] and not force:
+        if self.current_config.board_built and not force:
             log_info("Board已编译，跳过编译步骤")
             return True
         
         log_info("开始编译Board适配...")
         
         try:
-            board = self.current_config.get("board", "mac")
+            board = self.current_config.board
             board_dir = self.sdk_path / "board" / board
             
             if not board_dir.exists():
@@ -394,18 +592,19 @@ class LinxOSBuilder:
             
             # 清理构建目录（如果强制重新编译）
             if force and board_build_dir.exists():
-                shutil.rmtree(board_build_dir)
+                _fast_rmtree(board_build_dir)
             
             board_build_dir.mkdir(exist_ok=True)
             
             # 配置CMake
             cmake_args = [
                 "cmake",
-                f"-DCMAKE_BUILD_TYPE={self.current_config['build_type']}"
+                *self._cmake_generator,
+                f"-DCMAKE_BUILD_TYPE={self.current_config.build_type}"
             ]
             
             # 添加工具链文件（如果有）
-            toolchain_file = self.current_config.get('toolchain_file')
+            toolchain_file = self.current_config.toolchain_file
             if toolchain_file:
                 toolchain_path = self.build_dir / "toolchains" / toolchain_file
                 if toolchain_path.exists():
@@ -420,22 +619,16 @@ class LinxOSBuilder:
                 log_error("Board CMake配置失败")
                 return False
             
-            # 编译Board
-            make_args = ["make", "-j", str(os.cpu_count() or 4)]
-            log_info(f"编译Board: {' '.join(make_args)}")
-            result = subprocess.run(make_args, cwd=board_build_dir)
-            
-            if result.returncode != 0:
-                log_error("Board编译失败")
-                return False
-            
-            # 安装Board
-            install_args = ["make", "install"]
-            log_info(f"安装Board: {' '.join(install_args)}")
-            result = subprocess.run(install_args, cwd=board_build_dir)
-            
+            # 编译并安装Board（单次 cmake --build 驱动，免去多次 make 进程开销）
+            build_args = ["cmake", "--build", str(board_build_dir), "--target", "install",
+                          "-j", self._jobs]
+            log_info(f"编译Board: {' '.join(build_args)}")
+            result = subprocess.run(build_args)
+
             if result.returncode == 0:
-                self.current_config["board_built"] = True
+                self._write_fingerprint(self._board_fingerprint_file(board), board_dir)
+                self._stat_cache.pop(self._board_lib_path(board), None)
+                self.current_config.board_built = True
                 log_success("Board编译成功")
                 return True
             else:
@@ -460,32 +653,57 @@ class LinxOSBuilder:
             log_error("Board编译失败，停止编译")
             return False
         
-        # 编译Examples
-        if not self.build_examples(force):
-            log_error("Examples编译失败，停止编译")
-            return False
-        
+        # SDK+Board 已验证，Examples 各子项目无需重复检查
+        self._deps_verified_this_run = True
+        try:
+            # 编译Examples
+            if not self.build_examples(force):
+                log_error("Examples编译失败，停止编译")
+                return False
+        finally:
+            self._deps_verified_this_run = False
+
         log_success("所有组件编译成功")
         return True
 
     def build_examples(self, force: bool = False) -> bool:
-        """编译所有示例程序"""
+        """编译所有示例程序（各示例构建目录独立，可并行）"""
         log_info("开始编译示例程序...")
-        
+
         if not self.projects["examples"]:
             log_warn("没有找到示例程序")
             return True
-        
+
+        # 先确保公共依赖就绪，避免并行任务重复触发 SDK/Board 编译
+        if not self._deps_verified_this_run:
+            if not self.build_sdk():
+                return False
+            if not self.build_board():
+                return False
+
         success_count = 0
         total_count = len(self.projects["examples"])
-        
-        for example_name in self.projects["examples"]:
-            log_info(f"编译示例: {example_name}")
-            if self.build_project("examples", example_name, force):
-                success_count += 1
-            else:
-                log_warn(f"示例编译失败: {example_name}")
-        
+
+        workers = min(4, os.cpu_count() or 2, total_count)
+        prev_verified = self._deps_verified_this_run
+        self._deps_verified_this_run = True
+        self._jobs_per_child = str(max(1, (os.cpu_count() or 4) // workers))
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self.build_project, "examples", name, force): name
+                    for name in self.projects["examples"]
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    example_name = futures[future]
+                    if future.result():
+                        success_count += 1
+                    else:
+                        log_warn(f"示例编译失败: {example_name}")
+        finally:
+            self._deps_verified_this_run = prev_verified
+            self._jobs_per_child = self._jobs
+
         if success_count == total_count:
             log_success(f"所有示例编译成功 ({success_count}/{total_count})")
             return True
@@ -508,25 +726,27 @@ class LinxOSBuilder:
         
         log_info(f"开始编译项目: {project_type}/{project_name}")
         
-        # 确保SDK和Board已编译
-        if not self.build_sdk():
-            return False
-        
-        if not self.build_board():
-            return False
+        # 确保SDK和Board已编译（本次运行已验证过则直接跳过）
+        if not self._deps_verified_this_run:
+            if not self.build_sdk():
+                return False
+
+            if not self.build_board():
+                return False
         
         # 编译项目
         try:
             build_dir = project_path / "build"
             if force and build_dir.exists():
-                shutil.rmtree(build_dir)
+                _fast_rmtree(build_dir)
             
             build_dir.mkdir(exist_ok=True)
             
             # 配置CMake
             cmake_args = [
                 "cmake",
-                f"-DCMAKE_BUILD_TYPE={self.current_config['build_type']}",
+                *self._cmake_generator,
+                f"-DCMAKE_BUILD_TYPE={self.current_config.build_type}",
                 str(project_path)
             ]
             
@@ -536,20 +756,20 @@ class LinxOSBuilder:
                 log_error("CMake配置失败")
                 return False
             
-            # 编译项目
-            make_args = ["make", "-j", str(os.cpu_count() or 4)]
-            log_info(f"编译项目: {' '.join(make_args)}")
-            result = subprocess.run(make_args, cwd=build_dir)
+            # 编译项目（cmake --build 驱动，与生成器无关）
+            build_args = ["cmake", "--build", str(build_dir),
+                          "-j", self._jobs_per_child]
+            log_info(f"编译项目: {' '.join(build_args)}")
+            result = subprocess.run(build_args)
             
             if result.returncode == 0:
+                self._record_built_project(project_type, project_name)
                 log_success(f"项目编译成功: {project_type}/{project_name}")
                 
                 # 显示可执行文件位置
-                bin_dir = build_dir / "bin"
-                if bin_dir.exists():
-                    for exe in bin_dir.iterdir():
-                        if exe.is_file() and os.access(exe, os.X_OK):
-                            log_info(f"可执行文件: {exe}")
+                exe_file = _find_executable(build_dir / "bin")
+                if exe_file:
+                    log_info(f"可执行文件: {exe_file}")
                 
                 return True
             else:
@@ -575,14 +795,8 @@ class LinxOSBuilder:
         build_dir = project_path / "build"
         
         # 查找可执行文件
-        exe_file = None
-        bin_dir = build_dir / "bin"
-        if bin_dir.exists():
-            for exe in bin_dir.iterdir():
-                if exe.is_file() and os.access(exe, os.X_OK):
-                    exe_file = exe
-                    break
-        
+        exe_file = _find_executable(build_dir / "bin")
+
         if not exe_file:
             log_error(f"未找到可执行文件，请先编译项目")
             return False
@@ -609,7 +823,7 @@ class LinxOSBuilder:
                 project_path = Path(self.projects[project_type][project_name]["path"])
                 build_dir = project_path / "build"
                 if build_dir.exists():
-                    shutil.rmtree(build_dir)
+                    _fast_rmtree(build_dir)
                     log_success(f"已清理项目: {project_type}/{project_name}")
                 else:
                     log_info(f"项目无需清理: {project_type}/{project_name}")
@@ -618,29 +832,35 @@ class LinxOSBuilder:
         else:
             # 清理所有
             log_info("清理所有编译文件...")
-            
+
+            # 先读取清单，清单文件随 out_dir 一起删除
+            built = self._load_built_manifest() | self._built_projects
+
             # 清理SDK构建文件
             if self.build_dir.exists():
-                shutil.rmtree(self.build_dir)
+                _fast_rmtree(self.build_dir)
                 log_info("已清理SDK构建文件")
-            
+
             # 清理输出文件
             if self.out_dir.exists():
-                shutil.rmtree(self.out_dir)
+                _fast_rmtree(self.out_dir)
                 log_info("已清理输出文件")
-            
-            # 清理项目构建文件
-            for project_type in self.projects:
-                for project_name, project_info in self.projects[project_type].items():
-                    project_path = Path(project_info["path"])
-                    build_dir = project_path / "build"
-                    if build_dir.exists():
-                        shutil.rmtree(build_dir)
-                        log_info(f"已清理项目: {project_type}/{project_name}")
+
+            # 只清理清单中编译过的项目，避免遍历全部项目目录
+            for key in sorted(built):
+                project_type, _, project_name = key.partition("/")
+                project_info = self.projects.get(project_type, {}).get(project_name)
+                if project_info is None:
+                    continue
+                build_dir = Path(project_info["path"]) / "build"
+                if build_dir.exists():
+                    _fast_rmtree(build_dir)
+                    log_info(f"已清理项目: {key}")
+            self._built_projects.clear()
             
             # 重置状态
-            self.current_config["sdk_built"] = False
-            self.current_config["board_built"] = False
+            self.current_config.sdk_built = False
+            self.current_config.board_built = False
             
             log_success("清理完成")
 
@@ -699,31 +919,24 @@ def main():
         log_warn("build-board 命令已弃用，请使用 'build board'")
         builder.build_board(args.force)
     elif args.command == "build":
-        if args.target == "sdk":
-            builder.build_sdk(args.force)
-        elif args.target == "board":
-            builder.build_board(args.force)
-        elif args.target == "all":
-            builder.build_all(args.force)
-        elif args.target == "examples":
-            builder.build_examples(args.force)
-        elif args.target == "apps":
+        def build_app():
             if not args.project_name:
                 log_error("编译apps时必须指定项目名称")
                 return
             builder.build_project("apps", args.project_name, args.force)
-        elif args.target in ["apps", "examples"]:
-            if not args.project_name:
-                log_error(f"编译{args.target}时必须指定项目名称")
-                return
-            builder.build_project(args.target, args.project_name, args.force)
-        else:
-            # 尝试作为项目类型和名称处理 (向后兼容)
-            if args.target in ["apps", "examples"] and args.project_name:
-                builder.build_project(args.target, args.project_name, args.force)
-            else:
-                log_error(f"无效的编译目标: {args.target}")
-                log_info("可用目标: sdk, board, all, examples, apps <project_name>")
+
+        def unknown_target():
+            log_error(f"无效的编译目标: {args.target}")
+            log_info("可用目标: sdk, board, all, examples, apps <project_name>")
+
+        handlers = {
+            "sdk": lambda: builder.build_sdk(args.force),
+            "board": lambda: builder.build_board(args.force),
+            "all": lambda: builder.build_all(args.force),
+            "examples": lambda: builder.build_examples(args.force),
+            "apps": build_app,
+        }
+        handlers.get(args.target, unknown_target)()
     elif args.command == "run":
         builder.run_project(args.project_type, args.project_name, args.args)
     elif args.command == "clean":
@@ -731,7 +944,7 @@ def main():
     else:
         # 默认显示项目列表
         builder.list_projects()
-        print(f"\n{Colors.CYAN}使用示例:{Colors.NC}")
+        print(f"\n{CYAN}使用示例:{NC}")
         print("  linxos.py config choice          # 配置选择")
         print("  linxos.py build sdk              # 编译SDK")
         print("  linxos.py build board            # 编译Board适配")